@@ -50,6 +50,9 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "json_logs": False,
         "color": True,
     },
+    "output": {
+        "pretty_json": False,
+    },
     "metrics": {
         "report_interval": 10,
         "include_system": True,
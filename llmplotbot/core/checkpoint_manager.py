@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict
 
+from ..utils.serialization import dumps
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CheckpointState:
     last_job_id: str | None
     total_completed: int
@@ -64,7 +65,7 @@ class CheckpointManager:
         }
         timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(state.timestamp))
         path = self.checkpoint_dir / f"checkpoint-{timestamp}.json"
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        path.write_bytes(dumps(payload, indent=True))
         self.logger.debug("Checkpoint written to %s", path)
 
 
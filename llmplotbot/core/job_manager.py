@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
+import queue
 import sqlite3
-import threading
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from llmplotbot.utils.titles import Headline
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+# Applied to every connection. WAL itself is persistent and is enabled
+# once in ``initialize``; with it, NORMAL sync only fsyncs at checkpoints.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Job:
     identifier: str
     title: str
@@ -30,16 +39,17 @@ class Job:
 class JobManager:
     """Manages durable job state and provides workers with pending tasks."""
 
-    def __init__(self, db_path: str | Path, *, logger) -> None:
+    def __init__(self, db_path: str | Path, *, logger, pool_size: int = 8) -> None:
         self.db_path = Path(db_path)
         self.logger = logger
-        self._lock = threading.Lock()
         self._connect_kwargs = {"detect_types": sqlite3.PARSE_DECLTYPES}
+        self._pool: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=max(1, pool_size))
 
     # ------------------------------------------------------------------
     def initialize(self) -> None:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._connect() as conn:
+        with self._borrow() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS jobs (
@@ -55,6 +65,15 @@ class JobManager:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_jobs_pending_updated
+                ON jobs (status, updated_at) WHERE status='pending'
+                """
+            )
+            # The partial index above also covers the pending COUNT; a plain
+            # status index only adds write cost, so drop it from older databases.
+            conn.execute("DROP INDEX IF EXISTS idx_jobs_status")
             conn.commit()
         self.recover_incomplete_jobs()
 
@@ -62,12 +81,42 @@ class JobManager:
     def _connect(self) -> sqlite3.Connection:
         conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False, **self._connect_kwargs)
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
         return conn
 
+    @contextmanager
+    def _borrow(self) -> Iterator[sqlite3.Connection]:
+        """Lend a pooled connection, opening a new one when the pool is empty."""
+
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            with conn:
+                yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                return
+            conn.close()
+
     # ------------------------------------------------------------------
     def recover_incomplete_jobs(self) -> None:
         now = self._timestamp()
-        with self._connect() as conn:
+        with self._borrow() as conn:
             conn.execute(
                 "UPDATE jobs SET status='pending', updated_at=? WHERE status='processing'",
                 (now,),
@@ -76,57 +125,76 @@ class JobManager:
 
     # ------------------------------------------------------------------
     def seed_jobs(self, headlines: Iterable[Headline]) -> int:
-        inserted = 0
         now = self._timestamp()
-        with self._connect() as conn:
-            conn.execute("BEGIN")
-            for headline in headlines:
-                result = conn.execute(
-                    """
-                    INSERT OR IGNORE INTO jobs (id, title, file_path, status, updated_at)
-                    VALUES (?, ?, ?, 'pending', ?)
-                    """,
-                    (headline.identifier, headline.title, headline.source_path, now),
-                )
-                inserted += result.rowcount
+        rows = [(headline.identifier, headline.title, headline.source_path, now) for headline in headlines]
+        with self._borrow() as conn:
+            before = conn.total_changes
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO jobs (id, title, file_path, status, updated_at)
+                VALUES (?, ?, ?, 'pending', ?)
+                """,
+                rows,
+            )
             conn.commit()
+            inserted = conn.total_changes - before
         if inserted:
             self.logger.info("Seeded %d new job(s) into queue", inserted)
         return inserted
 
     # ------------------------------------------------------------------
     def fetch_job(self) -> Optional[Job]:
-        with self._lock:
-            with self._connect() as conn:
-                conn.execute("BEGIN IMMEDIATE")
-                row = conn.execute(
-                    "SELECT * FROM jobs WHERE status='pending' ORDER BY updated_at LIMIT 1"
-                ).fetchone()
-                if not row:
-                    conn.commit()
-                    return None
-                now = self._timestamp()
-                conn.execute(
-                    "UPDATE jobs SET status='processing', updated_at=? WHERE id=?",
-                    (now, row["id"]),
+        jobs = self.fetch_jobs(1)
+        return jobs[0] if jobs else None
+
+    def fetch_jobs(self, limit: int) -> List[Job]:
+        """Atomically claim up to ``limit`` pending jobs, oldest first."""
+
+        now = self._timestamp()
+        with self._borrow() as conn:
+            rows = conn.execute(
+                """
+                UPDATE jobs SET status='processing', updated_at=?
+                WHERE id IN (
+                    SELECT id FROM jobs WHERE status='pending' ORDER BY updated_at LIMIT ?
                 )
-                conn.commit()
-        return Job(
-            identifier=row["id"],
-            title=row["title"],
-            file_path=row["file_path"],
-            status="processing",
-            retries=row["retries"],
-            last_error=row["last_error"],
-            result_path=row["result_path"],
-            prompt_hash=row["prompt_hash"],
-            updated_at=row["updated_at"],
-        )
+                RETURNING *
+                """,
+                (now, max(1, limit)),
+            ).fetchall()
+            conn.commit()
+        return [
+            Job(
+                identifier=row["id"],
+                title=row["title"],
+                file_path=row["file_path"],
+                status=row["status"],
+                retries=row["retries"],
+                last_error=row["last_error"],
+                result_path=row["result_path"],
+                prompt_hash=row["prompt_hash"],
+                updated_at=row["updated_at"],
+            )
+            for row in rows
+        ]
+
+    # ------------------------------------------------------------------
+    def release_jobs(self, job_ids: Iterable[str]) -> None:
+        """Return claimed but unprocessed jobs to the pending queue."""
+
+        now = self._timestamp()
+        with self._borrow() as conn:
+            conn.executemany(
+                "UPDATE jobs SET status='pending', updated_at=? WHERE id=? AND status='processing'",
+                [(now, job_id) for job_id in job_ids],
+            )
+            conn.commit()
 
     # ------------------------------------------------------------------
     def mark_success(self, job_id: str, *, result_path: str, prompt_hash: str) -> None:
         now = self._timestamp()
-        with self._connect() as conn:
+        with self._borrow() as conn:
             conn.execute(
                 """
                 UPDATE jobs
@@ -140,18 +208,16 @@ class JobManager:
     # ------------------------------------------------------------------
     def mark_failure(self, job_id: str, *, error: str, retry: bool, retry_limit: int) -> None:
         now = self._timestamp()
-        with self._connect() as conn:
+        with self._borrow() as conn:
             if retry:
-                row = conn.execute("SELECT retries FROM jobs WHERE id=?", (job_id,)).fetchone()
-                retries = int(row["retries"] if row else 0) + 1
-                status = "pending" if retries < retry_limit else "failed"
                 conn.execute(
                     """
                     UPDATE jobs
-                    SET status=?, retries=?, last_error=?, updated_at=?
+                    SET status=CASE WHEN retries + 1 < ? THEN 'pending' ELSE 'failed' END,
+                        retries=retries + 1, last_error=?, updated_at=?
                     WHERE id=?
                     """,
-                    (status, retries, error, now, job_id),
+                    (retry_limit, error, now, job_id),
                 )
             else:
                 conn.execute(
@@ -166,19 +232,19 @@ class JobManager:
 
     # ------------------------------------------------------------------
     def pending_jobs(self) -> int:
-        with self._connect() as conn:
+        with self._borrow() as conn:
             row = conn.execute("SELECT COUNT(*) FROM jobs WHERE status='pending'").fetchone()
             return int(row[0]) if row else 0
 
     # ------------------------------------------------------------------
     def total_jobs(self) -> int:
-        with self._connect() as conn:
+        with self._borrow() as conn:
             row = conn.execute("SELECT COUNT(*) FROM jobs").fetchone()
             return int(row[0]) if row else 0
 
     # ------------------------------------------------------------------
     def _timestamp(self) -> str:
-        return datetime.utcnow().strftime(ISO_FORMAT)
+        return time.strftime(ISO_FORMAT, time.gmtime())
 
 
 __all__ = ["Job", "JobManager"]
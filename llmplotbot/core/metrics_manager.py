@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
-from collections import defaultdict
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Mapping
+from typing import Any, BinaryIO, Deque, Dict, Mapping, Tuple
 
+from ..utils.serialization import dumps
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MetricSnapshot:
     total_jobs: int
     success: int
@@ -21,6 +22,15 @@ class MetricSnapshot:
     avg_tokens: float
 
 
+@dataclass(slots=True)
+class ModelStats:
+    success: int = 0
+    failure: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    tokens: float = 0.0
+
+
 class MetricsManager:
     def __init__(
         self,
@@ -36,92 +46,98 @@ class MetricsManager:
         self.report_interval = report_interval
         self.include_system = include_system
         self.logger = logger
-        self._queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+        # Events are plain tuples appended from the event loop; run() drains
+        # them in batches whenever it is woken rather than once per event.
+        self._events: Deque[Tuple[Any, ...]] = deque()
+        self._wakeup = asyncio.Event()
         self._stop = asyncio.Event()
-        self._model_stats: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        self._job_counts = defaultdict(float)
+        self._model_stats: Dict[str, ModelStats] = {}
         self._last_flush = time.monotonic()
+        self._handle: BinaryIO | None = None
 
     # ------------------------------------------------------------------
     def record_success(self, model: str, *, elapsed: float, tokens: int) -> None:
-        self._queue.put_nowait(
-            {
-                "type": "success",
-                "model": model,
-                "elapsed": float(elapsed),
-                "tokens": int(tokens),
-            }
-        )
+        self._push(("success", model, float(elapsed), int(tokens)))
 
     def record_failure(self, model: str) -> None:
-        self._queue.put_nowait({"type": "failure", "model": model})
+        self._push(("failure", model))
 
     def record_retry(self, model: str) -> None:
-        self._queue.put_nowait({"type": "retry", "model": model})
+        self._push(("retry", model))
 
     def record_system_stats(self, stats: Mapping[str, Any]) -> None:
         if not self.include_system:
             return
-        self._queue.put_nowait({"type": "system", "payload": dict(stats)})
+        self._push(("system", dict(stats)))
+
+    def _push(self, event: Tuple[Any, ...]) -> None:
+        self._events.append(event)
+        self._wakeup.set()
 
     # ------------------------------------------------------------------
     async def run(self) -> None:
         while not self._stop.is_set():
             try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=self.report_interval)
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.report_interval)
             except asyncio.TimeoutError:
                 self._flush()
                 continue
-            self._apply_event(event)
-        while not self._queue.empty():
-            self._apply_event(await self._queue.get())
+            self._wakeup.clear()
+            self._drain()
+        self._drain()
         self._flush(final=True)
+        self._close()
 
     def stop(self) -> None:
         self._stop.set()
+        self._wakeup.set()
 
     # ------------------------------------------------------------------
     def summary(self) -> Dict[str, Any]:
         result: Dict[str, Any] = {"models": {}}
         for model, stats in self._model_stats.items():
-            success = stats.get("success", 0)
-            failure = stats.get("failure", 0)
-            retries = stats.get("retries", 0)
-            elapsed = stats.get("elapsed", 0.0)
-            tokens = stats.get("tokens", 0.0)
-            total = success + failure
-            avg_elapsed = elapsed / success if success else 0.0
-            avg_tokens = tokens / success if success else 0.0
+            success = stats.success
+            avg_elapsed = stats.elapsed / success if success else 0.0
+            avg_tokens = stats.tokens / success if success else 0.0
             result["models"][model] = {
-                "success": int(success),
-                "failure": int(failure),
-                "retries": int(retries),
+                "success": success,
+                "failure": stats.failure,
+                "retries": stats.retries,
                 "avg_elapsed": avg_elapsed,
                 "avg_tokens": avg_tokens,
-                "total": int(total),
+                "total": success + stats.failure,
             }
         result["timestamp"] = time.time()
         return result
 
     # ------------------------------------------------------------------
-    def _apply_event(self, event: Mapping[str, Any]) -> None:
-        event_type = event.get("type")
-        model = event.get("model")
-        if event_type == "success" and model:
-            stats = self._model_stats[model]
-            stats["success"] += 1
-            stats["elapsed"] += float(event.get("elapsed", 0.0))
-            stats["tokens"] += float(event.get("tokens", 0))
-        elif event_type == "failure" and model:
-            self._model_stats[model]["failure"] += 1
-        elif event_type == "retry" and model:
-            self._model_stats[model]["retries"] += 1
-        elif event_type == "system":
-            payload = event.get("payload")
-            if isinstance(payload, Mapping):
-                self._append_json({"type": "system", **payload})
+    def _drain(self) -> None:
+        events = self._events
+        while events:
+            self._apply_event(events.popleft())
         self._maybe_flush()
 
+    def _apply_event(self, event: Tuple[Any, ...]) -> None:
+        event_type = event[0]
+        if event_type == "system":
+            self._append_json({"type": "system", **event[1]})
+            return
+        stats = self._stats_for(event[1])
+        if event_type == "success":
+            stats.success += 1
+            stats.elapsed += event[2]
+            stats.tokens += event[3]
+        elif event_type == "failure":
+            stats.failure += 1
+        elif event_type == "retry":
+            stats.retries += 1
+
+    def _stats_for(self, model: str) -> ModelStats:
+        stats = self._model_stats.get(model)
+        if stats is None:
+            stats = self._model_stats[model] = ModelStats()
+        return stats
+
     def _maybe_flush(self) -> None:
         if time.monotonic() - self._last_flush >= self.report_interval:
             self._flush()
@@ -130,12 +146,22 @@ class MetricsManager:
         snapshot = self.summary()
         snapshot["final"] = final
         self._append_json(snapshot)
+        # System samples between snapshots stay buffered; each snapshot
+        # pushes everything written so far out to disk.
+        if self._handle is not None:
+            self._handle.flush()
         self._last_flush = time.monotonic()
         self.logger.debug("Metrics snapshot written")
 
     def _append_json(self, payload: Mapping[str, Any]) -> None:
-        with self.metrics_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        if self._handle is None:
+            self._handle = self.metrics_path.open("ab", buffering=1 << 16)
+        self._handle.write(dumps(payload))
+
+    def _close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
 
 
-__all__ = ["MetricsManager", "MetricSnapshot"]
+__all__ = ["MetricsManager", "MetricSnapshot", "ModelStats"]
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
 import time
 from typing import Any, Dict, Mapping
 
 import httpx
 
+from ..utils.serialization import loads
+
 
 class OllamaConnector:
     def __init__(
@@ -17,12 +18,18 @@ class OllamaConnector:
         model: str,
         timeout: float,
         logger,
+        max_connections: int = 1,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.model = model
         self.logger = logger
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout)
-        self._lock = asyncio.Lock()
+        # The client is safe for concurrent use; size its pool so every
+        # worker sharing this connector can keep a connection alive.
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=timeout, limits=limits)
 
     async def generate(self, prompt: str, headline: str) -> Dict[str, Any]:
         payload = {
@@ -34,12 +41,11 @@ class OllamaConnector:
             "temperature": 0.7,
             "stream": False,
         }
-        async with self._lock:
-            start = time.perf_counter()
-            response = await self._client.post("/v1/chat/completions", json=payload)
-            elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        response = await self._client.post("/v1/chat/completions", json=payload)
+        elapsed = time.perf_counter() - start
         response.raise_for_status()
-        data = response.json()
+        data = loads(response.content)
         text = self.extract_text(data)
         tokens = 0
         usage = data.get("usage")
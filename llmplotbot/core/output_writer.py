@@ -2,18 +2,26 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Mapping
 
 from .job_manager import Job
+from ..utils.serialization import dumps
 
 
 class OutputWriter:
-    def __init__(self, outputs_dir: str | Path, failed_dir: str | Path, *, logger) -> None:
+    def __init__(
+        self,
+        outputs_dir: str | Path,
+        failed_dir: str | Path,
+        *,
+        logger,
+        pretty: bool = False,
+    ) -> None:
         self.outputs_dir = Path(outputs_dir)
         self.failed_dir = Path(failed_dir)
         self.logger = logger
+        self.pretty = pretty
         self.outputs_dir.mkdir(parents=True, exist_ok=True)
         self.failed_dir.mkdir(parents=True, exist_ok=True)
 
@@ -67,7 +75,7 @@ class OutputWriter:
 
     def _atomic_dump(self, path: Path, payload: Dict[str, Any]) -> None:
         tmp_path = path.with_suffix(path.suffix + ".tmp")
-        tmp_path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        tmp_path.write_bytes(dumps(payload, indent=self.pretty))
         tmp_path.replace(path)
 
 
@@ -12,6 +12,11 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - psutil may be unavailable
     psutil = None
 
+try:  # pragma: no cover - optional dependency (nvidia-ml-py)
+    import pynvml  # type: ignore
+except Exception:  # pragma: no cover - NVML bindings may be unavailable
+    pynvml = None
+
 
 class SystemMonitor:
     def __init__(self, *, interval: float, metrics, logger) -> None:
@@ -19,22 +24,56 @@ class SystemMonitor:
         self.metrics = metrics
         self.logger = logger
         self._running = False
-        self._has_nvidia_smi = shutil.which("nvidia-smi") is not None
+        self._gpu_handle: Any = None
+        self._has_nvidia_smi = False
 
     async def run(self, stop_event: asyncio.Event) -> None:
         self._running = True
-        while not stop_event.is_set():
-            try:
-                stats = self._collect_stats()
-                if stats:
-                    self.metrics.record_system_stats(stats)
-            except Exception as exc:  # pragma: no cover - defensive
-                self.logger.debug("System monitor failed: %s", exc)
-            try:
-                await asyncio.wait_for(stop_event.wait(), timeout=self.interval)
-            except asyncio.TimeoutError:
-                continue
-        self._running = False
+        # NVML is initialised and shut down here so it never outlives run().
+        self._gpu_handle = self._init_nvml()
+        self._has_nvidia_smi = self._gpu_handle is None and shutil.which("nvidia-smi") is not None
+        try:
+            while not stop_event.is_set():
+                try:
+                    stats = self._collect_stats()
+                    if stats:
+                        self.metrics.record_system_stats(stats)
+                except Exception as exc:  # pragma: no cover - defensive
+                    self.logger.debug("System monitor failed: %s", exc)
+                try:
+                    await asyncio.wait_for(stop_event.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    continue
+        finally:
+            self._running = False
+            self._shutdown_nvml()
+
+    def _init_nvml(self) -> Any:
+        if pynvml is None:
+            return None
+        try:
+            pynvml.nvmlInit()
+        except Exception:  # pragma: no cover - no NVIDIA driver
+            return None
+        try:
+            if pynvml.nvmlDeviceGetCount() > 0:
+                return pynvml.nvmlDeviceGetHandleByIndex(0)
+        except Exception:  # pragma: no cover - device query failed
+            pass
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:  # pragma: no cover - best effort
+            pass
+        return None
+
+    def _shutdown_nvml(self) -> None:
+        if self._gpu_handle is None:
+            return
+        self._gpu_handle = None
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:  # pragma: no cover - best effort
+            pass
 
     def _collect_stats(self) -> Dict[str, Any]:
         stats: Dict[str, Any] = {}
@@ -49,6 +88,8 @@ class SystemMonitor:
         return stats
 
     def _gpu_stats(self) -> Dict[str, Any]:
+        if self._gpu_handle is not None:
+            return self._nvml_stats()
         if not self._has_nvidia_smi:
             return {}
         try:
@@ -72,5 +113,16 @@ class SystemMonitor:
             stats["gpu_memory_used_mb"] = float(values[1])
         return stats
 
+    def _nvml_stats(self) -> Dict[str, Any]:
+        try:
+            utilization = pynvml.nvmlDeviceGetUtilizationRates(self._gpu_handle)
+            memory = pynvml.nvmlDeviceGetMemoryInfo(self._gpu_handle)
+        except Exception:  # pragma: no cover - GPU optional
+            return {}
+        return {
+            "gpu_utilization_percent": float(utilization.gpu),
+            "gpu_memory_used_mb": round(memory.used / (1024 * 1024), 2),
+        }
+
 
 __all__ = ["SystemMonitor"]
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import json
-import math
+import random
 import time
+from collections import deque
 from dataclasses import dataclass
 from typing import Dict, Iterable, Mapping, MutableMapping
 
@@ -16,9 +17,10 @@ from .job_manager import Job, JobManager
 from .ollama import OllamaConnector
 from .output_writer import OutputWriter
 from ..utils.prompts import PromptBundle
+from ..utils.serialization import loads
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     max_attempts: int
     backoff_seconds: float
@@ -46,7 +48,10 @@ class WorkerPool:
         self.retry_config = retry_config
         self.logger = logger
         self.testing_limit = testing_limit
-        self._counter_lock = asyncio.Lock()
+        self._claim_lock = asyncio.Lock()
+        self._claimed: deque[Job] = deque()
+        self._claim_batch = 1
+        self._pending = 0
         self._completed = 0
         self._failed = 0
         self._processed = 0
@@ -61,52 +66,92 @@ class WorkerPool:
         max_concurrency: int,
     ) -> None:
         self.shutdown.install()
-        model_list = list(models)
+        workers = max(1, max_concurrency)
+        self._claim_batch = workers
+        self._pending = await asyncio.to_thread(self.job_manager.pending_jobs)
+        # One connector (and connection pool) per model, shared by all workers.
+        connectors = {
+            model: OllamaConnector(
+                base_url=base_url,
+                model=model,
+                timeout=timeout,
+                logger=self.logger,
+                max_connections=workers,
+            )
+            for model in models
+        }
         tasks = [
             asyncio.create_task(
-                self._worker(idx, prompt, model_list, base_url, timeout),
+                self._worker(idx, prompt, connectors),
                 name=f"worker-{idx}",
             )
-            for idx in range(max(1, max_concurrency))
+            for idx in range(workers)
         ]
-        await asyncio.gather(*tasks)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # If one worker failed the others are still running; stop them
+            # before releasing jobs and closing the connectors they share.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._release_claimed()
+            for connector in connectors.values():
+                try:
+                    await connector.aclose()
+                except Exception:  # pragma: no cover - cleanup best effort
+                    pass
 
     async def _worker(
         self,
         worker_id: int,
         prompt: PromptBundle,
-        models: list[str],
-        base_url: str,
-        timeout: float,
+        connectors: Mapping[str, OllamaConnector],
     ) -> None:
-        connectors = {
-            model: OllamaConnector(base_url=base_url, model=model, timeout=timeout, logger=self.logger)
-            for model in models
-        }
-        try:
-            while not self.shutdown.is_triggered():
-                if not await self._can_process_next():
+        while not self.shutdown.is_triggered():
+            if not self._can_process_next():
+                break
+            job = await self._next_job()
+            if not job:
+                pending = await asyncio.to_thread(self.job_manager.pending_jobs)
+                if pending == 0:
                     break
-                job = await asyncio.to_thread(self.job_manager.fetch_job)
-                if not job:
-                    pending = await asyncio.to_thread(self.job_manager.pending_jobs)
-                    if pending == 0:
-                        break
-                    await asyncio.sleep(0.5)
-                    continue
+                await asyncio.sleep(0.5)
+                continue
+            try:
                 await self._process_job(job, prompt, connectors)
-        finally:
-            for connector in connectors.values():
-                try:
-                    await connector.aclose()
-                except Exception:  # pragma: no cover - cleanup best effort
-                    pass
+            except BaseException:
+                # Hand the interrupted job back so run() releases it.
+                self._claimed.append(job)
+                raise
 
-    async def _can_process_next(self) -> bool:
+    async def _next_job(self) -> Job | None:
+        # Claim a batch per SQLite round trip and hand jobs out locally.
+        async with self._claim_lock:
+            if not self._claimed:
+                jobs = await asyncio.to_thread(self.job_manager.fetch_jobs, self._claim_batch)
+                self._claimed.extend(jobs)
+                # Claims are the only way jobs leave 'pending' during a run, so
+                # track the count here instead of re-counting per completion.
+                # A short batch means the queue was drained at claim time.
+                if len(jobs) < self._claim_batch:
+                    self._pending = 0
+                else:
+                    self._pending = max(0, self._pending - len(jobs))
+            return self._claimed.popleft() if self._claimed else None
+
+    async def _release_claimed(self) -> None:
+        if not self._claimed:
+            return
+        job_ids = [job.identifier for job in self._claimed]
+        self._claimed.clear()
+        await asyncio.to_thread(self.job_manager.release_jobs, job_ids)
+        self.logger.debug("Released %d unprocessed job(s) back to the queue", len(job_ids))
+
+    def _can_process_next(self) -> bool:
         if self.testing_limit is None:
             return True
-        async with self._counter_lock:
-            return self._processed < self.testing_limit
+        return self._processed < self.testing_limit
 
     async def _process_job(
         self,
@@ -116,26 +161,36 @@ class WorkerPool:
     ) -> None:
         successes: Dict[str, MutableMapping[str, object]] = {}
         failures: Dict[str, MutableMapping[str, object]] = {}
-        for model, connector in connectors.items():
-            if self.shutdown.is_triggered():
-                break
-            result = await self._invoke_model(job, model, connector, prompt)
+        targets = [] if self.shutdown.is_triggered() else list(connectors.items())
+        # Models are independent endpoints; query them concurrently so a job
+        # takes as long as its slowest model rather than the sum of all.
+        results = await asyncio.gather(
+            *(self._invoke_model(job, model, connector, prompt) for model, connector in targets)
+        )
+        for (model, _), result in zip(targets, results):
             if result["status"] == "success":
                 successes[model] = result["payload"]
             else:
                 failures[model] = {"error": result["error"]}
-        path = self.output_writer.write(
+        path = await asyncio.to_thread(
+            self.output_writer.write,
             job,
             prompt_hash=prompt.prompt_hash,
             successes=successes,
             failures=failures,
         )
         if successes:
-            self.job_manager.mark_success(job.identifier, result_path=str(path), prompt_hash=prompt.prompt_hash)
+            await asyncio.to_thread(
+                self.job_manager.mark_success,
+                job.identifier,
+                result_path=str(path),
+                prompt_hash=prompt.prompt_hash,
+            )
             await self._update_counters(completed=1, failed=0, last_job_id=job.identifier)
         else:
             error_messages = "; ".join(payload.get("error", "") for payload in failures.values())
-            self.job_manager.mark_failure(
+            await asyncio.to_thread(
+                self.job_manager.mark_failure,
                 job.identifier,
                 error=error_messages or "Model failure",
                 retry=False,
@@ -188,32 +243,35 @@ class WorkerPool:
     def _parse_response(self, text: str) -> MutableMapping[str, object]:
         if not text:
             raise json.JSONDecodeError("Empty response", text, 0)
-        parsed = json.loads(text)
-        if isinstance(parsed, MutableMapping):
-            return dict(parsed)
+        parsed = loads(text)
+        if isinstance(parsed, dict):
+            # Freshly parsed and never shared, so no defensive copy is needed.
+            return parsed
         if isinstance(parsed, list):
             return {"items": parsed}
         return {"value": parsed}
 
     async def _update_counters(self, *, completed: int, failed: int, last_job_id: str) -> None:
-        pending = await asyncio.to_thread(self.job_manager.pending_jobs)
-        timestamp = time.time()
-        async with self._counter_lock:
-            self._completed += completed
-            self._failed += failed
-            self._processed += completed + failed
-            state = CheckpointState(
-                last_job_id=last_job_id,
-                total_completed=self._completed,
-                total_failed=self._failed,
-                pending=pending,
-                timestamp=timestamp,
-            )
+        # Counters are only touched on the event loop thread and there is no
+        # await between the updates and the snapshot, so no lock is needed.
+        self._completed += completed
+        self._failed += failed
+        self._processed += completed + failed
+        state = CheckpointState(
+            last_job_id=last_job_id,
+            total_completed=self._completed,
+            total_failed=self._failed,
+            pending=self._pending,
+            timestamp=time.time(),
+        )
         self.checkpoint_manager.maybe_checkpoint(state)
 
     def _backoff(self, attempt: int) -> float:
-        delay = self.retry_config.backoff_seconds * math.pow(2, max(0, attempt - 1))
-        return float(min(self.retry_config.max_backoff_seconds, delay))
+        # Clamp the exponent; anything past 2**30 is far beyond any sane cap.
+        delay = self.retry_config.backoff_seconds * (1 << min(30, max(0, attempt - 1)))
+        delay = min(self.retry_config.max_backoff_seconds, delay)
+        # Jitter so workers that failed together do not retry in lockstep.
+        return random.uniform(delay / 2, delay)
 
 
 __all__ = ["WorkerPool", "RetryConfig"]
@@ -57,11 +57,18 @@ def configure_logging(config: Mapping[str, object]) -> logging.Logger:
     log_dir = config.get("log_dir") or config.get("logs") or config.get("directory")
 
     logger = logging.getLogger("LLMPlotBot")
-    logger.setLevel(logging.DEBUG)
 
     # Remove previous handlers to avoid duplicates in tests.
     for handler in list(logger.handlers):
         logger.removeHandler(handler)
+        handler.close()
+
+    # None of our formats use thread, process or task names; skip
+    # collecting them for every record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(console_level)
@@ -89,6 +96,11 @@ def configure_logging(config: Mapping[str, object]) -> logging.Logger:
             )
         logger.addHandler(file_handler)
 
+    # Let the logger drop records no handler would emit, so suppressed
+    # debug calls on hot paths return before a LogRecord is built. Clamp to
+    # DEBUG: a NOTSET handler accepts everything, but a NOTSET logger would
+    # defer to the root logger's WARNING level instead.
+    logger.setLevel(max(logging.DEBUG, min(handler.level for handler in logger.handlers)))
     return logger
 
 
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from .config import load_config
 from .core import (
@@ -20,8 +19,9 @@ from .core import (
     WorkerPool,
 )
 from .logging_utils import configure_logging
-from .utils.prompts import PromptManager
-from .utils.titles import load_titles
+from .utils.prompts import PromptBundle, PromptManager
+from .utils.serialization import dumps
+from .utils.titles import Headline, load_titles
 
 
 class LLMPlotBotRuntime:
@@ -60,10 +60,16 @@ class LLMPlotBotRuntime:
             return False
         self.logger.info("Loaded prompt hash %s", prompt_bundle.prompt_hash)
 
+        title_limit = None
+        if testing_config.get("enabled"):
+            max_jobs = int(testing_config.get("max_jobs", 0))
+            if max_jobs > 0:
+                title_limit = max_jobs
         try:
             titles = load_titles(
                 paths.get("titles_index"),
                 source_dir=paths.get("titles_source"),
+                limit=title_limit,
             )
         except FileNotFoundError as exc:
             self.logger.error("Titles index not found: %s", exc)
@@ -71,13 +77,28 @@ class LLMPlotBotRuntime:
         except ValueError as exc:
             self.logger.error("Invalid titles index: %s", exc)
             return False
-        if testing_config.get("enabled"):
-            max_jobs = int(testing_config.get("max_jobs", 0))
-            if max_jobs > 0:
-                titles = titles[:max_jobs]
-                self.logger.info("Test mode active: limiting to %d headline(s)", len(titles))
+        if title_limit is not None:
+            self.logger.info("Test mode active: limiting to %d headline(s)", len(titles))
 
-        job_manager = JobManager(paths.get("jobs_db"), logger=self.logger)
+        max_concurrency = int(self.config.get("model", {}).get("max_concurrency", 1))
+        job_manager = JobManager(
+            paths.get("jobs_db"),
+            logger=self.logger,
+            pool_size=max_concurrency + 1,
+        )
+        try:
+            return await self._process(job_manager, titles, prompt_bundle, paths, testing_config)
+        finally:
+            job_manager.close()
+
+    async def _process(
+        self,
+        job_manager: JobManager,
+        titles: List[Headline],
+        prompt_bundle: PromptBundle,
+        paths: Dict[str, Any],
+        testing_config: Dict[str, Any],
+    ) -> bool:
         job_manager.initialize()
         job_manager.seed_jobs(titles)
         if job_manager.pending_jobs() == 0:
@@ -96,7 +117,12 @@ class LLMPlotBotRuntime:
             jobs_per_checkpoint=int(self.config.get("checkpoints", {}).get("jobs_per_checkpoint", 25)),
             logger=self.logger,
         )
-        output_writer = OutputWriter(paths.get("outputs"), paths.get("failed"), logger=self.logger)
+        output_writer = OutputWriter(
+            paths.get("outputs"),
+            paths.get("failed"),
+            logger=self.logger,
+            pretty=bool(self.config.get("output", {}).get("pretty_json", False)),
+        )
         shutdown = GracefulShutdown()
         retry_cfg = self.config.get("model", {}).get("retry", {})
         testing_limit = None
@@ -173,7 +199,7 @@ class LLMPlotBotRuntime:
         target_dir.mkdir(parents=True, exist_ok=True)
         timestamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
         summary_path = target_dir / f"run-summary-{timestamp}.json"
-        summary_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        summary_path.write_bytes(dumps(summary, indent=True))
         self.logger.info("Run summary written to %s", summary_path)
 
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import hashlib
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 
 
@@ -25,9 +25,10 @@ class PromptManager:
 
     def load(self) -> PromptBundle:
         path = self.prompt_dir / self.filename
-        if not path.exists():
-            raise FileNotFoundError(f"Prompt file not found: {path}")
-        text = path.read_text(encoding="utf-8").strip()
+        try:
+            text = path.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt file not found: {path}") from None
         prompt_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
         bundle = PromptBundle(prompt=text, prompt_hash=prompt_hash, source_path=path)
         self._archive_prompt(bundle)
@@ -37,9 +38,17 @@ class PromptManager:
         if not self.archive_dir:
             return
         self.archive_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+        # The hash suffix identifies the content; an unchanged prompt is
+        # already archived from an earlier run.
+        if next(self.archive_dir.glob(f"prompt-*-{bundle.prompt_hash[:12]}.txt"), None) is not None:
+            return
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
         archive_path = self.archive_dir / f"prompt-{timestamp}-{bundle.prompt_hash[:12]}.txt"
-        archive_path.write_text(bundle.prompt + "\n", encoding="utf-8")
+        # Write via a temp file so a crash never leaves a truncated archive
+        # that would satisfy the existence check above.
+        tmp_path = archive_path.with_suffix(archive_path.suffix + ".tmp")
+        tmp_path.write_bytes((bundle.prompt + "\n").encode("utf-8"))
+        tmp_path.replace(archive_path)
 
 
 __all__ = ["PromptBundle", "PromptManager"]
@@ -0,0 +1,38 @@
+"""JSON encoding helpers with an optional orjson fast path."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - orjson may be unavailable
+    orjson = None
+
+
+def dumps(payload: Any, *, indent: bool = False) -> bytes:
+    """Serialise ``payload`` to UTF-8 JSON bytes terminated by a newline."""
+
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(payload, option=option)
+    if indent:
+        text = json.dumps(payload, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return (text + "\n").encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from ``data``; failures raise :class:`json.JSONDecodeError`."""
+
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["dumps", "loads"]
@@ -2,33 +2,42 @@
 
 from __future__ import annotations
 
-import json
 from json import JSONDecodeError
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator, List, Tuple
 
+from .serialization import dumps, loads
 
-@dataclass(frozen=True)
+
+@dataclass(slots=True, frozen=True)
 class Headline:
     identifier: str
     title: str
     source_path: str | None = None
 
 
-def load_titles(path: str | Path, *, source_dir: str | Path | None = None) -> List[Headline]:
+def load_titles(
+    path: str | Path,
+    *,
+    source_dir: str | Path | None = None,
+    limit: int | None = None,
+) -> List[Headline]:
     file_path = Path(path)
-    if not file_path.exists():
+    try:
+        raw = file_path.read_bytes()
+    except FileNotFoundError:
         if not source_dir:
-            raise FileNotFoundError(f"Titles index not found: {file_path}")
+            raise FileNotFoundError(f"Titles index not found: {file_path}") from None
         _regenerate_titles_index(file_path, Path(source_dir))
+        raw = file_path.read_bytes()
     try:
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        data = loads(raw)
     except JSONDecodeError:
         if not source_dir:
             raise
         _regenerate_titles_index(file_path, Path(source_dir))
-        data = json.loads(file_path.read_text(encoding="utf-8"))
+        data = loads(file_path.read_bytes())
     headlines: List[Headline] = []
     if isinstance(data, dict):
         iterable: Iterable[tuple[str, object]] = data.items()
@@ -48,6 +57,8 @@ def load_titles(path: str | Path, *, source_dir: str | Path | None = None) -> Li
         if not title:
             continue
         headlines.append(Headline(identifier=identifier, title=title, source_path=source))
+        if limit is not None and len(headlines) >= limit:
+            break
     return headlines
 
 
@@ -60,7 +71,7 @@ def _regenerate_titles_index(index_path: Path, source_dir: Path) -> None:
     entries: list[dict[str, str]] = []
     seen: set[str] = set()
     for json_file in sorted(source_dir.glob("*.json")):
-        raw = json.loads(json_file.read_text(encoding="utf-8"))
+        raw = loads(json_file.read_bytes())
         for counter, (identifier, title) in enumerate(_extract_entries(raw)):
             identifier = identifier.strip()
             title = title.strip()
@@ -85,7 +96,7 @@ def _regenerate_titles_index(index_path: Path, source_dir: Path) -> None:
         )
 
     index_path.parent.mkdir(parents=True, exist_ok=True)
-    index_path.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    index_path.write_bytes(dumps(entries))
 
 
 def _extract_entries(data: object) -> Iterator[Tuple[str, str]]: